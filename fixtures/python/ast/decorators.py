@@ -2,6 +2,7 @@
 
 import functools
 import asyncio
+import time
 from typing import Any, Callable, TypeVar, Optional
 from dataclasses import dataclass
 from abc import ABC, abstractmethod
@@ -35,11 +36,12 @@ def repeat(times: int = 2):
 # Class decorator
 def singleton(cls):
     """Class decorator for singleton pattern"""
-    instances = {}
+    instance = None
     def get_instance(*args, **kwargs):
-        if cls not in instances:
-            instances[cls] = cls(*args, **kwargs)
-        return instances[cls]
+        nonlocal instance
+        if instance is None:
+            instance = cls(*args, **kwargs)
+        return instance
     return get_instance
 
 
@@ -80,12 +82,11 @@ class Configuration:
 def async_timer(func: Callable) -> Callable:
     """Decorator for async functions"""
     @functools.wraps(func)
-    async def wrapper(*args, **kwargs):
-        import time
-        start = time.time()
+    async def wrapper(*args, _pc=time.perf_counter_ns, **kwargs):
+        start = _pc()
         result = await func(*args, **kwargs)
-        end = time.time()
-        print(f"{func.__name__} took {end - start:.4f} seconds")
+        end = _pc()
+        print(f"{func.__name__} took {(end - start) / 1e9:.4f} seconds")
         return result
     return wrapper
 
@@ -1,5 +1,6 @@
 """Python AST test fixtures for inheritance patterns"""
 
+import math
 from abc import ABC, abstractmethod
 from typing import List, Optional, Generic, TypeVar
 from dataclasses import dataclass
@@ -106,11 +107,9 @@ class Circle(Shape):
         self.radius = radius
 
     def area(self) -> float:
-        import math
         return math.pi * self.radius ** 2
 
     def perimeter(self) -> float:
-        import math
         return 2 * math.pi * self.radius
 
 
@@ -1,17 +1,29 @@
 """Python AST test fixtures for metaclasses and advanced patterns"""
 
-from typing import Any, Dict, Type
+import functools
 import inspect
+import logging
+import operator
+import threading
+
+_tracer = logging.getLogger("traced")
+_MISSING = object()
 
 # Simple metaclass
 class SingletonMeta(type):
     """Metaclass for singleton pattern"""
-    _instances: Dict[Type, Any] = {}
+    _lock = threading.Lock()
 
     def __call__(cls, *args, **kwargs):
-        if cls not in cls._instances:
-            cls._instances[cls] = super().__call__(*args, **kwargs)
-        return cls._instances[cls]
+        # Each class holds its own instance, so no registry pins classes alive
+        instance = cls.__dict__.get('_singleton_instance', _MISSING)
+        if instance is _MISSING:
+            with SingletonMeta._lock:
+                instance = cls.__dict__.get('_singleton_instance', _MISSING)
+                if instance is _MISSING:
+                    instance = super().__call__(*args, **kwargs)
+                    type.__setattr__(cls, '_singleton_instance', instance)
+        return instance
 
 
 class SingletonService(metaclass=SingletonMeta):
@@ -46,22 +58,26 @@ class ValidatedClass(metaclass=ValidatedMeta):
 class TracedMeta(type):
     """Metaclass that adds tracing to all methods"""
     def __new__(mcs, name, bases, namespace):
-        # Wrap all methods with tracing
-        for key, value in namespace.items():
-            if callable(value) and not key.startswith('_'):
-                namespace[key] = mcs.trace_method(value)
+        # Wrap all public methods with tracing
+        namespace.update({
+            key: mcs.trace_method(value)
+            for key, value in namespace.items()
+            if key[:1] != '_' and callable(value)
+        })
 
         return super().__new__(mcs, name, bases, namespace)
 
     @staticmethod
     def trace_method(method):
+        @functools.wraps(method)
         def wrapper(*args, **kwargs):
-            print(f"Calling {method.__name__}")
+            # Tracing costs a single level check unless DEBUG is enabled
+            if not _tracer.isEnabledFor(logging.DEBUG):
+                return method(*args, **kwargs)
+            _tracer.debug("Calling %s", method.__name__)
             result = method(*args, **kwargs)
-            print(f"Finished {method.__name__}")
+            _tracer.debug("Finished %s", method.__name__)
             return result
-        wrapper.__name__ = method.__name__
-        wrapper.__doc__ = method.__doc__
         return wrapper
 
 
@@ -81,20 +97,18 @@ class InterfaceMeta(type):
         # Check if this is the interface itself
         if name != 'Interface' and bases:
             # Verify all abstract methods are implemented
-            for base in bases:
-                if hasattr(base, '_abstract_methods'):
-                    for method_name in base._abstract_methods:
-                        if method_name not in namespace:
-                            raise TypeError(
-                                f"Class {name} must implement {method_name}"
-                            )
+            required = frozenset().union(
+                *(getattr(base, '_abstract_methods', ()) for base in bases)
+            )
+            missing = required - namespace.keys()
+            if missing:
+                raise TypeError(f"Class {name} must implement {sorted(missing)}")
 
         # Mark abstract methods
-        abstract_methods = []
-        for key, value in namespace.items():
-            if getattr(value, '_is_abstract', False):
-                abstract_methods.append(key)
-        namespace['_abstract_methods'] = abstract_methods
+        namespace['_abstract_methods'] = frozenset(
+            key for key, value in namespace.items()
+            if getattr(value, '_is_abstract', False)
+        )
 
         return super().__new__(mcs, name, bases, namespace)
 
@@ -132,13 +146,12 @@ class DynamicMeta(type):
         """Create a property dynamically"""
         private_name = f'_{field_name}'
 
-        def getter(self):
-            return getattr(self, private_name, None)
-
-        def setter(self, value):
-            setattr(self, private_name, value)
+        def setter(self, value, _name=private_name):
+            self.__dict__[_name] = value
 
-        namespace[field_name] = property(getter, setter)
+        # Unset fields read the class-level None instead of raising
+        namespace.setdefault(private_name, None)
+        namespace[field_name] = property(operator.attrgetter(private_name), setter)
 
 
 class DynamicModel(metaclass=DynamicMeta, version="1.0"):
@@ -156,9 +169,8 @@ class OrderedMeta(type):
     """Metaclass that preserves attribute definition order"""
     @classmethod
     def __prepare__(mcs, name, bases):
-        # Return an OrderedDict to preserve order
-        from collections import OrderedDict
-        return OrderedDict()
+        # A plain dict already keeps insertion order
+        return {}
 
     def __new__(mcs, name, bases, namespace):
         # Store the order of attributes
@@ -200,11 +212,13 @@ class ComplexClass(metaclass=ExtendedMeta):
 # __init_subclass__ alternative to metaclass
 class PluginBase:
     """Base class using __init_subclass__ instead of metaclass"""
-    plugins = []
+    # Registered plugin classes in definition order; dict keys keep
+    # registration idempotent
+    plugins = {}
 
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__(**kwargs)
-        cls.plugins.append(cls)
+        cls.plugins[cls] = None
 
         # Add automatic registration
         if 'plugin_name' in kwargs:
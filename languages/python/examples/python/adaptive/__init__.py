@@ -0,0 +1,19 @@
+"""Adaptive testing helpers for the Python example.
+
+Public names are resolved lazily (PEP 562): importing ``Signature`` or
+``DiscoveryEngine`` does not load ``test_base`` and, through it, pytest.
+"""
+
+from typing import Any
+
+__all__ = ["Signature", "DiscoveryEngine", "AdaptiveTest"]
+
+
+def __getattr__(name: str) -> Any:
+    if name in ("Signature", "DiscoveryEngine"):
+        from . import discovery
+        return getattr(discovery, name)
+    if name == "AdaptiveTest":
+        from .test_base import AdaptiveTest
+        return AdaptiveTest
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
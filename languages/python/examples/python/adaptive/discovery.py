@@ -2,102 +2,474 @@
 
 from __future__ import annotations
 
+import ast
+import concurrent.futures
+import functools
+import hashlib
+import importlib
+import importlib.abc
+import importlib.machinery
 import importlib.util
 import inspect
+import json
 import os
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
 from pathlib import Path
 from types import ModuleType
-from typing import Any, Iterable, List, Optional
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, List, Optional, Set, Tuple
 
+# Persistent symbol index shared by every discovery root on this machine.
+_INDEX_FILE = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "adaptive-tests"
+    / "index.json"
+)
 
-@dataclass
+# Bump when the stored layout changes or _read_symbols starts recording
+# something new, so indexes written by older versions are rebuilt.
+_INDEX_VERSION = 4
+
+# symbol name -> [(file path, kind, methods defined in the class body)]
+SymbolIndex = Dict[str, List[Tuple[str, str, List[str]]]]
+
+# (st_mtime_ns, st_size) of a source file. The size catches rewrites that land
+# within the filesystem's mtime granularity.
+FileStamp = Tuple[int, int]
+
+# (path, stamp) pairs whose execution raised; retried only once the file changes.
+_FAILED_IMPORTS: Set[Tuple[str, Optional[FileStamp]]] = set()
+
+# path -> stamp of the source when the module was last executed.
+_LOADED_STAMPS: Dict[str, Optional[FileStamp]] = {}
+
+# path -> (stamp, module) for files loaded outside the root's package.
+_PATH_MODULES: Dict[str, Tuple[Optional[FileStamp], ModuleType]] = {}
+
+# Below this many files to parse, thread start-up costs more than it saves.
+_PARALLEL_PARSE_THRESHOLD = 16
+
+# ``slots=True`` is only understood by dataclasses on Python 3.10+.
+_DATACLASS_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class Signature:
     name: str
-    methods: Optional[List[str]] = None
+    methods: Tuple[str, ...] = ()
     type: Optional[str] = None  # 'class', 'module', 'function'
-    properties: Optional[List[str]] = None
-    exports: Optional[List[str]] = None
+    properties: Tuple[str, ...] = ()
+    exports: Tuple[str, ...] = ()
+    # Suffixes used to recognise module signatures by name or file path
+    _name_suffixes: Tuple[str, str] = field(init=False, repr=False, compare=False)
+    _path_suffixes: Tuple[str, str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Store sequences as tuples so signatures are hashable cache keys
+        for name in ('methods', 'properties', 'exports'):
+            value = getattr(self, name)
+            if not isinstance(value, tuple):
+                object.__setattr__(self, name, tuple(value or ()))
+        name = self.name
+        object.__setattr__(self, '_name_suffixes', (f".{name}", f".{name}.__init__"))
+        object.__setattr__(self, '_path_suffixes', (f"/{name}/__init__.py", f"/{name}.py"))
 
 
 class DiscoveryEngine:
-    def __init__(self, root: Optional[str] = None) -> None:
+    # Directories that never contain discovery targets; pruned before descent.
+    _SKIP_DIRS: FrozenSet[str] = frozenset({
+        "__pycache__",
+        ".git",
+        ".venv",
+        "venv",
+        "node_modules",
+        "site-packages",
+        "build",
+        "dist",
+        ".tox",
+        ".mypy_cache",
+        ".pytest_cache",
+        # Test suites consume discovered code rather than define it; pass an
+        # explicit ``skip_dirs`` to discover helpers that live under tests/.
+        "tests",
+        "coverage",
+    })
+
+    def __init__(
+        self,
+        root: Optional[str] = None,
+        skip_dirs: Optional[Iterable[str]] = None,
+    ) -> None:
         self.root = Path(root or os.getcwd()).resolve()
+        self.skip_dirs = frozenset(skip_dirs) if skip_dirs is not None else self._SKIP_DIRS
+        self._index: Optional[SymbolIndex] = None
+        self._stamps: Dict[str, FileStamp] = {}
+        self._results: Dict[Signature, Any] = {}
+        self._finder = _finder_for(self.root)
 
     def discover(self, signature: Signature) -> Any:
-        for module in self._iter_modules():
+        return _shared_engine(str(self.root), self.skip_dirs)._discover_cached(signature)
+
+    def _discover_cached(self, signature: Signature) -> Any:
+        """Resolve ``signature``, reusing earlier results while no file changed."""
+        self._load_or_build_index()
+        try:
+            return self._results[signature]
+        except KeyError:
+            pass
+        target = self._results[signature] = self._discover(signature)
+        return target
+
+    def _discover(self, signature: Signature) -> Any:
+        for module in self._iter_modules(signature):
             target = self._match(module, signature)
             if target is not None:
                 return target
         raise LookupError(f"No match for {signature}")
 
-    def _iter_modules(self) -> Iterable[ModuleType]:
-        for file in self.root.rglob('*.py'):
-            if file.name.startswith('test_'):
+    def _iter_modules(self, signature: Signature) -> Iterable[ModuleType]:
+        index = self._index if self._index is not None else self._load_or_build_index()
+        for path, kind, _methods in index.get(signature.name, ()):
+            # A module named after the target only matters for module signatures
+            if kind == 'module' and signature.type != 'module':
                 continue
-
-            # For __init__.py files, use the package name (parent directory)
-            if file.name == '__init__.py':
-                module_name = file.parent.name
-            else:
-                module_name = file.stem
-
-            spec = importlib.util.spec_from_file_location(module_name, file)
-            if not spec or not spec.loader:
+            key = (path, self._stamps.get(path))
+            if key in _FAILED_IMPORTS:
                 continue
-            module = importlib.util.module_from_spec(spec)
             try:
-                spec.loader.exec_module(module)  # type: ignore[attr-defined]
+                module = self._import(*key)
             except Exception:
+                _FAILED_IMPORTS.add(key)
                 continue
             yield module
 
+    def _import(self, path: str, stamp: Optional[FileStamp] = None) -> ModuleType:
+        """Execute ``path`` as a module of this root's synthetic package.
+
+        Only the defining file runs: parent ``__init__.py`` files are imported
+        solely when the module itself needs them, e.g. for a relative import.
+        A module whose source changed since it was executed is run again, and
+        one that cannot be run in package context is loaded standalone.
+        """
+        parts = Path(path).relative_to(self.root).with_suffix('').parts
+        if parts and parts[-1] == '__init__':
+            parts = parts[:-1]
+        if not all(part.isidentifier() for part in parts):
+            return self._load_from_path(path, stamp)
+        name = ".".join((self._finder.prefix,) + parts)
+        module = sys.modules.get(name)
+        if module is None or _LOADED_STAMPS.get(path, stamp) != stamp:
+            try:
+                module = self._exec_as(name, path)
+            except Exception:
+                return self._load_from_path(path, stamp)
+        _LOADED_STAMPS[path] = stamp
+        return module
+
+    @staticmethod
+    def _exec_as(name: str, path: str) -> ModuleType:
+        """Execute ``path`` as module ``name`` without importing its parents first."""
+        locations = {}
+        if os.path.basename(path) == '__init__.py':
+            locations['submodule_search_locations'] = [os.path.dirname(path)]
+        spec = importlib.util.spec_from_file_location(name, path, **locations)
+        if not spec or not spec.loader:
+            raise ImportError(f"{path} cannot be loaded")
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            sys.modules.pop(name, None)
+            raise
+        return module
+
+    @staticmethod
+    def _load_from_path(path: str, stamp: Optional[FileStamp] = None) -> ModuleType:
+        """Execute ``path`` as a standalone module named after the file.
+
+        Used for files such as ``my-pkg/svc.py`` whose path is not a dotted
+        module name. The module is kept until the file changes.
+        """
+        cached = _PATH_MODULES.get(path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        file = Path(path)
+        module_name = file.parent.name if file.name == '__init__.py' else file.stem
+        spec = importlib.util.spec_from_file_location(module_name, file)
+        if not spec or not spec.loader:
+            raise ImportError(f"{path} cannot be loaded")
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _PATH_MODULES[path] = (stamp, module)
+        return module
+
+    def _load_or_build_index(self) -> SymbolIndex:
+        """Return the symbol index for ``self.root``, refreshing stale files.
+
+        The index is persisted between runs and revalidated on every call:
+        the tree is walked again, only files whose stamp changed are parsed,
+        and nothing is executed. Cached results are dropped when it changes.
+        """
+        root_key = str(self.root)
+        current: Dict[str, FileStamp] = {}
+        for entry in _walk(root_key, self.skip_dirs):
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            current[entry.path] = (stat.st_mtime_ns, stat.st_size)
+
+        if self._index is not None and current == self._stamps:
+            return self._index
+
+        stored = _read_index_file()
+        stamp_map: Dict[str, FileStamp]
+        symbols: SymbolIndex
+        if self._index is not None:
+            stamp_map, symbols = self._stamps, self._index
+        else:
+            entry = stored.get(root_key) or {}
+            if entry.get("version") != _INDEX_VERSION:
+                entry = {}
+            # JSON has no tuples; stamps come back as two-item lists
+            stamp_map = {path: tuple(stamp) for path, stamp in entry.get("stamps", {}).items()}
+            symbols = entry.get("symbols", {})
+
+        stale = [path for path, stamp in current.items() if stamp_map.get(path) != stamp]
+        dropped = set(stale).union(stamp_map.keys() - current.keys())
+        if dropped:
+            symbols = {
+                name: [item for item in items if item[0] not in dropped]
+                for name, items in symbols.items()
+            }
+            for path, file_symbols in zip(stale, _read_all_symbols(stale)):
+                for name, kind, methods in file_symbols:
+                    symbols.setdefault(name, []).append((path, kind, methods))
+            symbols = {name: items for name, items in symbols.items() if items}
+            stored[root_key] = {
+                "version": _INDEX_VERSION,
+                "stamps": current,
+                "symbols": symbols,
+            }
+            _write_index_file(stored)
+            # Files changed on disk; drop the import system's directory caches
+            importlib.invalidate_caches()
+            self._results.clear()
+
+        self._index = symbols
+        self._stamps = current
+        return symbols
+
     def _match(self, module: ModuleType, signature: Signature) -> Optional[Any]:
         # Handle module-level discovery
         if signature.type == 'module' and signature.exports:
-            # Check various module name patterns
-            module_file = str(module.__file__) if module.__file__ else ""
-            is_match = (
-                module.__name__ == signature.name or
-                module.__name__.endswith(f".{signature.name}") or
-                module.__name__.endswith(f".{signature.name}.__init__") or
-                f"/{signature.name}/__init__.py" in module_file or
-                f"/{signature.name}.py" in module_file
-            )
+            # Check various module name patterns, cheapest first
+            module_name = module.__name__
+            is_match = module_name == signature.name or module_name.endswith(signature._name_suffixes)
+            if not is_match and module.__file__:
+                module_file = str(module.__file__)
+                package_init, module_path = signature._path_suffixes
+                is_match = package_init in module_file or module_path in module_file
             if is_match:
                 # Check if module has the required exports
                 if all(hasattr(module, export) for export in signature.exports):
                     return module
 
         # Handle class and other discoveries
-        for name, obj in inspect.getmembers(module):
-            if name != signature.name:
-                continue
+        obj = module.__dict__.get(signature.name)
+        if obj is None:
+            return None
 
-            # Check class discovery
-            if inspect.isclass(obj):
-                # Check methods
-                if not self._has_methods(obj, signature.methods):
-                    continue
-                # Check properties if specified
-                if signature.properties and not self._has_properties(obj, signature.properties):
-                    continue
-                return obj
+        # Check class discovery
+        if inspect.isclass(obj):
+            # Check methods
+            if signature.methods and not self._has_methods(obj, signature.methods):
+                return None
+            # Check properties if specified
+            if signature.properties and not self._has_properties(obj, signature.properties):
+                return None
+            return obj
 
-            # Check function discovery
-            if signature.type == 'function' and inspect.isfunction(obj):
-                return obj
+        # Check function discovery
+        if signature.type == 'function' and inspect.isfunction(obj):
+            return obj
 
         return None
 
     @staticmethod
-    def _has_methods(obj: Any, methods: Optional[List[str]]) -> bool:
-        if not methods:
-            return True
-        return all(hasattr(obj, method) for method in methods)
+    def _has_methods(obj: Any, methods: Tuple[str, ...]) -> bool:
+        return _class_attrs(obj).issuperset(methods)
 
     @staticmethod
-    def _has_properties(obj: Any, properties: Optional[List[str]]) -> bool:
-        if not properties:
-            return True
-        return all(hasattr(obj, prop) for prop in properties)
+    def _has_properties(obj: Any, properties: Tuple[str, ...]) -> bool:
+        return _class_attrs(obj).issuperset(properties)
+
+
+class _RootFinder(importlib.abc.MetaPathFinder):
+    """Expose a discovery root as an importable package named ``prefix``.
+
+    Only the package itself is resolved here. Submodules pulled in by relative
+    imports are located by the regular path finder through ``__path__``, so
+    they use the standard source loader and bytecode cache.
+    """
+
+    def __init__(self, prefix: str, root: Path) -> None:
+        self.prefix = prefix
+        self.root = root
+
+    def find_spec(self, fullname: str, path: Any = None, target: Any = None) -> Optional[importlib.machinery.ModuleSpec]:
+        if fullname != self.prefix:
+            return None
+        init = self.root / '__init__.py'
+        if init.is_file():
+            return importlib.util.spec_from_file_location(
+                fullname, init, submodule_search_locations=[str(self.root)]
+            )
+        spec = importlib.machinery.ModuleSpec(fullname, None, is_package=True)
+        spec.submodule_search_locations = [str(self.root)]
+        return spec
+
+
+_ROOT_FINDERS: Dict[str, _RootFinder] = {}
+
+
+def _finder_for(root: Path) -> _RootFinder:
+    """Return the finder for ``root``, registering it on first use."""
+    key = str(root)
+    finder = _ROOT_FINDERS.get(key)
+    if finder is None:
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:10]
+        finder = _ROOT_FINDERS[key] = _RootFinder(f"_adaptive_discover_{digest}", root)
+        sys.meta_path.append(finder)
+    return finder
+
+
+@functools.lru_cache(maxsize=1024)
+def _class_attrs(cls: type) -> FrozenSet[str]:
+    """Attribute names visible on ``cls``, computed once per class."""
+    return frozenset(dir(cls))
+
+
+@functools.lru_cache(maxsize=None)
+def _shared_engine(root: str, skip_dirs: FrozenSet[str]) -> DiscoveryEngine:
+    """Engine holding the index and results for ``root``, shared per process."""
+    return DiscoveryEngine(root, skip_dirs)
+
+
+def _walk(path: str, skip_dirs: FrozenSet[str]) -> Iterator[os.DirEntry]:
+    """Yield ``DirEntry`` objects for candidate source files below ``path``.
+
+    Directories are scanned with ``os.scandir`` from an explicit stack rather
+    than by recursion. ``DirEntry`` caches the type information returned by
+    ``readdir`` so names can be filtered without an extra ``stat`` per entry,
+    and callers can reuse the entry for the one ``stat`` they need. Hidden
+    directories and anything in ``skip_dirs`` are pruned before descending.
+    """
+    stack = [path]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    name = entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        if name not in skip_dirs and not name.startswith('.'):
+                            stack.append(entry.path)
+                    elif (
+                        name.endswith('.py')
+                        and not name.startswith('test_')
+                        and not name.endswith('_test.py')
+                    ):
+                        yield entry
+        except OSError:
+            # Unreadable, missing or removed while walking
+            continue
+
+
+_BLOCK_NODES: Tuple[type, ...] = (ast.If, ast.Try, ast.With, ast.AsyncWith) + (
+    (ast.TryStar,) if hasattr(ast, 'TryStar') else ()
+)
+
+
+def _block_statements(node: ast.AST) -> List[ast.stmt]:
+    """Return the statements of a top-level block in source order."""
+    statements = list(getattr(node, 'body', []))
+    for handler in getattr(node, 'handlers', []):
+        statements.extend(handler.body)
+    statements.extend(getattr(node, 'orelse', []))
+    statements.extend(getattr(node, 'finalbody', []))
+    return statements
+
+
+def _read_symbols(path: str) -> List[Tuple[str, str, List[str]]]:
+    """Statically list the module name and top-level names bound in ``path``."""
+    file_name = os.path.basename(path)
+    if file_name == '__init__.py':
+        module_name = os.path.basename(os.path.dirname(path))
+    else:
+        module_name = file_name[:-3]
+    symbols: List[Tuple[str, str, List[str]]] = [(module_name, 'module', [])]
+
+    try:
+        with open(path, "rb") as handle:
+            tree = ast.parse(handle.read(), filename=path)
+    except (OSError, SyntaxError, ValueError):
+        return symbols
+
+    nodes = list(tree.body)
+    while nodes:
+        node = nodes.pop(0)
+        if isinstance(node, _BLOCK_NODES):
+            # Definitions guarded by ``if sys.version_info`` or ``try: import``
+            nodes[:0] = _block_statements(node)
+        elif isinstance(node, ast.ClassDef):
+            methods = [
+                child.name
+                for child in node.body
+                if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef))
+            ]
+            symbols.append((node.name, 'class', methods))
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            symbols.append((node.name, 'function', []))
+        elif isinstance(node, ast.Assign):
+            # Module-level aliases such as ``Service = _ServiceImpl``
+            for target in node.targets:
+                if isinstance(target, ast.Name):
+                    symbols.append((target.id, 'assign', []))
+        elif isinstance(node, ast.AnnAssign) and isinstance(node.target, ast.Name):
+            symbols.append((node.target.id, 'assign', []))
+    return symbols
+
+
+def _read_all_symbols(paths: List[str]) -> Iterable[List[Tuple[str, str, List[str]]]]:
+    """Parse ``paths`` in order, fanning out to threads for larger batches.
+
+    Reading and parsing many small files is largely I/O bound, and file reads
+    release the GIL, so a thread pool shortens cold index builds.
+    """
+    if len(paths) <= _PARALLEL_PARSE_THRESHOLD:
+        return map(_read_symbols, paths)
+    workers = min(32, (os.cpu_count() or 1) * 4)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_read_symbols, paths))
+
+
+def _read_index_file() -> Dict[str, Any]:
+    try:
+        with open(_INDEX_FILE, encoding="utf-8") as handle:
+            data = json.load(handle)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _write_index_file(data: Dict[str, Any]) -> None:
+    # Write to a temporary file first so concurrent test processes never
+    # observe a partially written index.
+    tmp = _INDEX_FILE.with_name(f"{_INDEX_FILE.name}.{os.getpid()}.tmp")
+    try:
+        _INDEX_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_text(json.dumps(data), encoding="utf-8")
+        os.replace(tmp, _INDEX_FILE)
+    except OSError:
+        pass
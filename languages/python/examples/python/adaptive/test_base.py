@@ -4,8 +4,14 @@ from __future__ import annotations
 
 import unittest
 import pytest
+from pathlib import Path
 from typing import Any, Dict, List, Optional, Type, Callable
-from .discovery import DiscoveryEngine, Signature
+from .discovery import DiscoveryEngine, Signature, _shared_engine
+
+
+def _engine_for(search_path: str) -> DiscoveryEngine:
+    """Return the engine shared by every test that searches ``search_path``"""
+    return _shared_engine(str(Path(search_path).resolve()), DiscoveryEngine._SKIP_DIRS)
 
 
 class AdaptiveTestBase(unittest.TestCase):
@@ -17,7 +23,7 @@ class AdaptiveTestBase(unittest.TestCase):
     def setUp(self) -> None:
         """Initialize discovery engine and discover target"""
         super().setUp()
-        self.discovery_engine = DiscoveryEngine(root=self.get_search_path())
+        self.discovery_engine = _engine_for(self.get_search_path())
 
         signature = self.get_target_signature()
         self.target = self.discovery_engine.discover(signature)
@@ -91,7 +97,7 @@ class AdaptivePytestBase:
     @pytest.fixture(autouse=True)
     def setup_discovery(self):
         """Setup fixture that runs before each test"""
-        self.discovery_engine = DiscoveryEngine(root=self.get_search_path())
+        self.discovery_engine = _engine_for(self.get_search_path())
 
         signature = self.get_target_signature()
         self.target = self.discovery_engine.discover(signature)
@@ -135,7 +141,7 @@ def adaptive_test(signature: Signature, search_path: str = ".") -> Callable:
     """
     def decorator(test_func: Callable) -> Callable:
         def wrapper(*args, **kwargs):
-            engine = DiscoveryEngine(root=search_path)
+            engine = _engine_for(search_path)
             target = engine.discover(signature)
 
             if target is None:
@@ -168,7 +174,7 @@ def adaptive_fixture(signature: Signature, search_path: str = "."):
     """
     @pytest.fixture
     def fixture_func():
-        engine = DiscoveryEngine(root=search_path)
+        engine = _engine_for(search_path)
         target = engine.discover(signature)
 
         if target is None:
@@ -202,7 +208,7 @@ class AdaptiveParametrize:
         def decorator(test_func: Callable) -> Callable:
             @pytest.mark.parametrize("service_name,methods", service_configs)
             def wrapper(service_name, methods):
-                engine = DiscoveryEngine(root=".")
+                engine = _engine_for(".")
                 ServiceClass = engine.discover(Signature(name=service_name, methods=methods))
 
                 if ServiceClass is None:
@@ -226,5 +232,10 @@ class AdaptiveTest:
 
     @classmethod
     def discover(cls) -> Any:
-        engine = DiscoveryEngine()
-        return engine.discover(cls.signature)
\ No newline at end of file
+        # Cache per class (not inherited) so subclasses resolve their own signature
+        target = cls.__dict__.get('_discovered')
+        if target is None:
+            engine = _engine_for(".")
+            target = engine.discover(cls.signature)
+            cls._discovered = target
+        return target
\ No newline at end of file
@@ -1,36 +1,41 @@
 """Example service with decorators for testing adaptive discovery"""
 
+import collections
 import functools
 import time
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Deque, Dict, List, Optional
 
 
 def timing_decorator(func: Callable) -> Callable:
     """Decorator to measure function execution time"""
     @functools.wraps(func)
-    def wrapper(*args, **kwargs):
-        start = time.time()
+    def wrapper(*args, _pc=time.perf_counter_ns, **kwargs):
+        start = _pc()
         result = func(*args, **kwargs)
-        end = time.time()
-        print(f"{func.__name__} took {end - start:.4f} seconds")
+        end = _pc()
+        print(f"{func.__name__} took {(end - start) / 1e9:.4f} seconds")
         return result
     return wrapper
 
 
 def cache_decorator(func: Callable) -> Callable:
-    """Simple caching decorator"""
-    cache = {}
+    """Per-instance caching decorator for methods (arguments must be hashable)
+
+    Results are kept in the instance's ``__dict__`` so they are released with
+    the instance rather than keeping ``self`` alive in a shared cache.
+    """
+    attr = f"_{func.__name__}_cache"
 
     @functools.wraps(func)
-    def wrapper(*args):
-        # Convert args to hashable form
-        cache_key = str(args)
-        if cache_key in cache:
-            print(f"Cache hit for {func.__name__}{args}")
-            return cache[cache_key]
-        result = func(*args)
-        cache[cache_key] = result
-        return result
+    def wrapper(self, *args):
+        cache = self.__dict__.get(attr)
+        if cache is None:
+            cache = self.__dict__[attr] = {}
+        try:
+            return cache[args]
+        except KeyError:
+            result = cache[args] = func(self, *args)
+            return result
     return wrapper
 
 
@@ -70,7 +75,7 @@ class DataService:
     @validate_input(lambda self, items: len(items) > 0)
     def process_items(self, items: List[str]) -> List[str]:
         """Process items with input validation"""
-        return [item.upper() for item in items]
+        return list(map(str.upper, items))
 
     @staticmethod
     @timing_decorator
@@ -79,9 +84,8 @@ class DataService:
         return value * 2
 
     @classmethod
-    @cache_decorator
     def create_from_config(cls, config: Dict[str, Any]) -> 'DataService':
-        """Class method with caching"""
+        """Class method factory"""
         source = config.get("source", "config")
         return cls(data_source=source)
 
@@ -104,7 +108,7 @@ class PropertyService:
 
     def __init__(self):
         self._value = 0
-        self._items = []
+        self._items: Deque[Any] = collections.deque()
 
     @property
     def value(self) -> int:
@@ -1,10 +1,16 @@
 """Simple Todo service used by the Python adaptive test example."""
 
+import sys
 from dataclasses import dataclass
-from typing import List
+from operator import attrgetter
+from typing import Dict, List
 
+# A Todo is allocated per add(), so drop its per-instance __dict__ wherever
+# dataclass() accepts ``slots`` (Python 3.10 and later).
+_DATACLASS_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_DATACLASS_SLOTS)
 class Todo:
     id: int
     title: str
@@ -12,8 +18,18 @@ class Todo:
 
 
 class TodoService:
+    """In-memory todo list.
+
+    Todos are also kept in per-status buckets so that filtered listings only
+    touch the todos they return. Mark todos done with ``complete()``; setting
+    ``Todo.completed`` directly bypasses the buckets.
+    """
+
     def __init__(self) -> None:
-        self._todos: List[Todo] = []
+        # Insertion-ordered and keyed by id, so listings keep creation order
+        self._by_id: Dict[int, Todo] = {}
+        self._active: Dict[int, Todo] = {}
+        self._completed: Dict[int, Todo] = {}
         self._next_id = 1
 
     def add(self, title: str) -> Todo:
@@ -21,32 +37,41 @@ class TodoService:
             raise ValueError("title is required")
         todo = Todo(id=self._next_id, title=title.strip())
         self._next_id += 1
-        self._todos.append(todo)
+        self._by_id[todo.id] = todo
+        self._active[todo.id] = todo
         return todo
 
     def complete(self, todo_id: int) -> Todo:
         todo = self._find(todo_id)
         todo.completed = True
+        if self._active.pop(todo_id, None) is not None:
+            self._completed[todo_id] = todo
         return todo
 
     def list(self, status: str = "all") -> List[Todo]:
         if status == "completed":
-            return [todo for todo in self._todos if todo.completed]
+            # The bucket fills in completion order; sorting by id restores
+            # creation order, in near-linear time as it is mostly sorted
+            return sorted(self._completed.values(), key=attrgetter("id"))
         if status == "active":
-            return [todo for todo in self._todos if not todo.completed]
-        return list(self._todos)
+            return list(self._active.values())
+        return list(self._by_id.values())
 
     def clear_completed(self) -> int:
-        before = len(self._todos)
-        self._todos = [todo for todo in self._todos if not todo.completed]
-        return before - len(self._todos)
+        for todo_id in self._completed:
+            del self._by_id[todo_id]
+        removed = len(self._completed)
+        self._completed.clear()
+        return removed
 
     def reset(self) -> None:
-        self._todos.clear()
+        self._by_id.clear()
+        self._active.clear()
+        self._completed.clear()
         self._next_id = 1
 
     def _find(self, todo_id: int) -> Todo:
-        for todo in self._todos:
-            if todo.id == todo_id:
-                return todo
-        raise ValueError("todo not found")
+        try:
+            return self._by_id[todo_id]
+        except KeyError:
+            raise ValueError("todo not found") from None
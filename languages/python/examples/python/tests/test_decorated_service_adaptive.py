@@ -1,5 +1,7 @@
 """Adaptive tests for decorated service with complex Python features"""
 
+import weakref
+
 import pytest
 from adaptive.discovery import DiscoveryEngine, Signature
 
@@ -26,6 +28,11 @@ def test_decorated_methods_discovery():
     second_call = service.compute_expensive(5)  # Should hit cache
     assert first_call == second_call == 25
 
+    # The cache belongs to the instance, so dropping it frees the service
+    service_ref = weakref.ref(service)
+    del service
+    assert service_ref() is None
+
 
 def test_static_and_class_methods():
     """Test discovery of static and class methods"""
@@ -119,9 +126,9 @@ def test_module_level_discovery():
 
 
 # Pytest fixtures for adaptive testing
-@pytest.fixture
+@pytest.fixture(scope="session")
 def discovery_engine():
-    """Fixture providing discovery engine instance"""
+    """Fixture providing a discovery engine shared across the session"""
     return DiscoveryEngine(root=".")
 
 
@@ -0,0 +1,73 @@
+from pathlib import Path
+
+import pytest
+from adaptive import discovery
+from adaptive.discovery import DiscoveryEngine, Signature
+
+
+@pytest.fixture
+def project(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    # Keep the persistent index out of the user's cache directory
+    monkeypatch.setattr(discovery, "_INDEX_FILE", tmp_path / "index.json")
+    root = tmp_path / "project"
+    root.mkdir()
+    return root
+
+
+def test_discover_sees_edited_and_new_files(project: Path):
+    source = project / "svc.py"
+    source.write_text("class Svc:\n    def a(self):\n        pass\n")
+    engine = DiscoveryEngine(root=str(project))
+    assert engine.discover(Signature(name="Svc", methods=["a"])).__name__ == "Svc"
+
+    source.write_text("class Svc:\n    def a(self):\n        pass\n\n    def b(self):\n        pass\n")
+    assert engine.discover(Signature(name="Svc", methods=["a", "b"])).__name__ == "Svc"
+
+    (project / "extra.py").write_text("class Extra:\n    pass\n")
+    assert DiscoveryEngine(root=str(project)).discover(Signature(name="Extra")).__name__ == "Extra"
+
+
+def test_discover_loads_files_outside_importable_packages(project: Path):
+    (project / "my-pkg").mkdir()
+    (project / "my-pkg" / "svc.py").write_text("class Dash:\n    pass\n")
+    target = DiscoveryEngine(root=str(project)).discover(Signature(name="Dash"))
+    assert (target.__module__, target.__name__) == ("svc", "Dash")
+
+
+def test_discover_returns_edited_class_body(project: Path):
+    source = project / "counter.py"
+    source.write_text("class Counter:\n    def value(self):\n        return 1\n")
+    engine = DiscoveryEngine(root=str(project))
+    assert engine.discover(Signature(name="Counter"))().value() == 1
+
+    source.write_text("class Counter:\n    def value(self):\n        return 20\n")
+    assert engine.discover(Signature(name="Counter"))().value() == 20
+
+
+def test_discover_does_not_run_parent_packages(project: Path):
+    package = project / "pkg"
+    package.mkdir()
+    # The parent __init__ fails outside its own sys.path entry and must not run
+    (package / "__init__.py").write_text("open(__file__ + '.ran', 'w').close()\nfrom pkg.svc import Svc\n")
+    (package / "svc.py").write_text("class Svc:\n    pass\n")
+    assert DiscoveryEngine(root=str(project)).discover(Signature(name="Svc")).__name__ == "Svc"
+    assert not (package / "__init__.py.ran").exists()
+
+
+def test_discover_finds_classes_under_version_checks(project: Path):
+    (project / "compat.py").write_text(
+        "import sys\n\nif sys.version_info >= (3,):\n    class Modern:\n        pass\nelse:\n    class Legacy:\n        pass\n"
+    )
+    assert DiscoveryEngine(root=str(project)).discover(Signature(name="Modern")).__name__ == "Modern"
+
+
+def test_discover_finds_classes_in_try_blocks(project: Path):
+    (project / "optional.py").write_text(
+        "try:\n    import missing_dependency_xyz\nexcept ImportError:\n    class Fallback:\n        pass\n"
+    )
+    assert DiscoveryEngine(root=str(project)).discover(Signature(name="Fallback")).__name__ == "Fallback"
+
+
+def test_discover_missing_root_raises_lookup_error(project: Path):
+    with pytest.raises(LookupError):
+        DiscoveryEngine(root=str(project / "missing")).discover(Signature(name="Svc"))
@@ -15,3 +15,17 @@ def test_filters_completed():
     completed = service.list("completed")
     assert len(completed) == 1
     assert completed[0].completed is True
+
+
+def test_filters_keep_creation_order():
+    service = TodoService()
+    first = service.add("First")
+    second = service.add("Second")
+    service.complete(second.id)
+    service.complete(first.id)
+    assert [todo.id for todo in service.list("completed")] == [first.id, second.id]
+    assert service.list("active") == []
+
+    third = service.add("Third")
+    assert service.clear_completed() == 2
+    assert service.list() == [third]
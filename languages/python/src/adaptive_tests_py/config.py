@@ -19,6 +19,7 @@ DEFAULT_CONFIG: Dict[str, Any] = {
     "discovery": {
         "extensions": [".py"],
         "max_depth": 12,
+        "workers": 1,
         "skip_directories": [
             "__pycache__",
             ".git",
@@ -10,6 +10,7 @@ breakdowns to aid debugging and signature tuning.
 from __future__ import annotations
 
 import ast
+import concurrent.futures
 import importlib
 import importlib.util
 import json
@@ -18,18 +19,24 @@ import os
 import re
 import sys
 import time
-from dataclasses import dataclass, field, asdict
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass, field, fields, asdict
 
 logger = logging.getLogger(__name__)
-from hashlib import sha1
+from hashlib import blake2b, sha1
 from pathlib import Path
-from typing import Any, Dict, Iterable, Iterator, List, MutableMapping, Optional, Sequence, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, MutableMapping, Optional, Sequence, Set, Tuple, Union
 
 from .config import ConfigLoader, DEFAULT_CONFIG
 from .scoring import CandidateSnapshot, ScoreReport, ScoringEngine
 
 
-@dataclass(frozen=True)
+# ``slots`` is only accepted by dataclass() from Python 3.10 onwards
+_DATACLASS_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class Signature:
     """Structure-based query used to locate a target symbol."""
 
@@ -43,6 +50,40 @@ class Signature:
     docstring_contains: Optional[Sequence[str]] = None
     regex: bool = False
     case_sensitive: bool = True
+    _hash: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Sequences are stored as tuples so signatures can key dicts and sets
+        for name in ("methods", "decorators", "bases", "docstring_contains"):
+            value = getattr(self, name)
+            if value is not None and not isinstance(value, tuple):
+                object.__setattr__(self, name, tuple(value))
+        object.__setattr__(
+            self,
+            "_hash",
+            hash(
+                (
+                    self.name,
+                    self.type,
+                    self.methods,
+                    self.module,
+                    self.module_pattern,
+                    self.decorators,
+                    self.bases,
+                    self.docstring_contains,
+                    self.regex,
+                    self.case_sensitive,
+                )
+            ),
+        )
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # Rebuild through __init__ so the hash is recomputed under the
+        # unpickling process's string hash seed
+        return type(self), tuple(getattr(self, f.name) for f in fields(self) if f.init)
 
     def to_mapping(self) -> Dict[str, Any]:
         return {
@@ -83,24 +124,11 @@ class DiscoveryResult:
         """Import and return the concrete Python object for this result."""
 
         module_name = self.module or self._fallback_module_name()
-        root_str = str(self.root)
-        cleanup_path = False
-
-        if root_str not in sys.path:
-            sys.path.insert(0, root_str)
-            cleanup_path = True
-
-        try:
+        with _root_on_path(self.root):
             try:
                 module = importlib.import_module(module_name)
             except ImportError:
                 module = self._load_module_from_path(module_name)
-        finally:
-            if cleanup_path:
-                try:
-                    sys.path.remove(root_str)
-                except ValueError:
-                    pass
 
         try:
             return getattr(module, self.name)
@@ -114,7 +142,7 @@ class DiscoveryResult:
         return data
 
     def _load_module_from_path(self, module_name: str) -> Any:
-        unique_suffix = sha1(str(self.file_path).encode("utf-8")).hexdigest()[:8]
+        unique_suffix = blake2b(str(self.file_path).encode("utf-8"), digest_size=4).hexdigest()
         fallback_name = f"{self._MODULE_NAMESPACE}.{module_name or unique_suffix}"
         spec = importlib.util.spec_from_file_location(fallback_name, self.file_path)
         if not spec or not spec.loader:
@@ -148,6 +176,28 @@ class _Candidate:
     decorators: Tuple[str, ...]
     bases: Tuple[str, ...]
     docstring: Optional[str]
+    name_lower: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.name_lower = self.name.lower()
+
+
+# Directory mtimes this recent (ns) are too close to a scan to be relied on.
+_RACY_MTIME_WINDOW_NS = 2_000_000_000
+
+# Parsed candidates per (root, file), reused while the file's mtime and size
+# are unchanged. Shared by all engines and bounded to the most recent files.
+_CacheEntry = Tuple[int, int, Tuple[_Candidate, ...]]
+
+# Bytes a source file must contain to be worth parsing: one literal, or a
+# pattern matching any of several (see _needle_gate).
+_Needle = Union[bytes, "re.Pattern[bytes]"]
+_CANDIDATE_CACHE_SIZE = 4096
+_CANDIDATE_CACHE: OrderedDict[Tuple[Path, Path], _CacheEntry] = OrderedDict()
+
+# Fewer uncached files than this are parsed in-process even when
+# ``discovery.workers`` allows more; starting workers would cost more.
+_PARALLEL_PARSE_THRESHOLD = 64
 
 
 class DiscoveryEngine:
@@ -172,8 +222,15 @@ class DiscoveryEngine:
 
         self._skip_dirs = tuple(merged_config["discovery"].get("skip_directories", ()))
         self._skip_files = tuple(merged_config["discovery"].get("skip_files", ()))
+        self._skip_dir_names = frozenset(fragment.rstrip('/') for fragment in self._skip_dirs)
+        self._skip_dir_re = _compile_any_substring(self._skip_dirs)
+        self._skip_file_re = _compile_any_glob(self._skip_files)
         self._extensions = tuple(merged_config["discovery"].get("extensions", (".py",)))
         self._max_depth = int(merged_config["discovery"].get("max_depth", 12))
+        self._workers = max(1, int(merged_config["discovery"].get("workers", 1)))
+        self._files: Optional[List[Path]] = None
+        self._dir_mtimes: Dict[str, int] = {}
+        self._files_trusted = False
 
     # ------------------------------------------------------------------
     # Public API
@@ -201,6 +258,44 @@ class DiscoveryEngine:
         matches.sort(key=lambda result: result.score, reverse=True)
         return matches
 
+    def discover_many(self, signatures: Sequence[Signature | Dict[str, Any]], *, load: bool = True) -> List[Any]:
+        """Discover several targets with one pass over the project.
+
+        Each file is read and parsed at most once for the whole batch, and a
+        candidate is only scored against signatures whose name can match it.
+        Results come back in the order of ``signatures``.
+        """
+
+        signature_maps = [self._normalise_signature(signature) for signature in signatures]
+        cache_keys = [self._cache_key(signature_map) for signature_map in signature_maps]
+        results: List[Optional[DiscoveryResult]] = [None] * len(signature_maps)
+        if self._cache_enabled:
+            self._ensure_cache_loaded()
+            results = [self._get_cached_result(cache_key) for cache_key in cache_keys]
+
+        pending = [index for index, result in enumerate(results) if result is None]
+        if pending:
+            found = self._best_matches([signature_maps[index] for index in pending])
+            for index, result in zip(pending, found):
+                if result is None:
+                    raise DiscoveryError(f"Could not locate target matching {signature_maps[index]!r}")
+                results[index] = result
+                if self._cache_enabled:
+                    self._remember(cache_keys[index], result)
+        return self.load_many(results) if load else results
+
+    def load_many(self, results: Iterable[DiscoveryResult]) -> List[Any]:
+        """Load several results with the project root put on ``sys.path`` once.
+
+        ``DiscoveryResult.load`` adds and removes the root around every call;
+        here it is added once for the whole batch. ``sys.path`` is still
+        process-global, so concurrent ``load``/``load_many`` calls from other
+        threads are not made safe by this and need their own locking.
+        """
+
+        with _root_on_path(self.root):
+            return [result.load() for result in results]
+
     def explain(self, signature: Signature | Dict[str, Any], *, limit: int = 5) -> List[Dict[str, Any]]:
         """Return top candidates with scoring details (Lens-style output)."""
 
@@ -215,7 +310,15 @@ class DiscoveryEngine:
             explanation.append(data)
         return explanation
 
+    def refresh(self) -> None:
+        """Forget the cached file list so the next discovery walks the tree again."""
+
+        self._files = None
+        self._dir_mtimes = {}
+
     def clear_cache(self) -> None:
+        for key in [key for key in _CANDIDATE_CACHE if key[0] == self.root]:
+            del _CANDIDATE_CACHE[key]
         self._runtime_cache.clear()
         self._persistent_cache.clear()
         self._cache_loaded = True
@@ -227,94 +330,266 @@ class DiscoveryEngine:
     # ------------------------------------------------------------------
     def _best_match(self, signature: Dict[str, Any]) -> DiscoveryResult:
         best: Optional[DiscoveryResult] = None
-        for candidate in self._match_candidates(signature):
+        for candidate in self._match_candidates(signature, best_only=True):
             if best is None or candidate.score > best.score:
                 best = candidate
         if best is None:
             raise DiscoveryError(f"Could not locate target matching {signature!r}")
         return best
 
-    def _match_candidates(self, signature: Dict[str, Any]) -> Iterator[DiscoveryResult]:
-        for file_path in self._iter_python_files():
-            for candidate in self._extract_candidates(file_path):
-                snapshot = CandidateSnapshot(
-                    name=candidate.name,
-                    type=candidate.type,
-                    module=candidate.module,
-                    file_path=candidate.file_path,
-                    methods=candidate.methods,
-                    decorators=candidate.decorators,
-                    bases=candidate.bases,
-                    docstring=candidate.docstring,
-                )
-                report = self.scoring_engine.score(snapshot, signature)
+    def _match_candidates(self, signature: Dict[str, Any], *, best_only: bool = False) -> Iterator[DiscoveryResult]:
+        """Yield scored candidates for ``signature``.
+
+        With ``best_only`` the caller only wants the highest score, so files
+        that cannot beat the best candidate yielded so far are not read, and
+        the search stops once a candidate reaches the signature's ceiling.
+        """
+
+        needle = self._name_needle(signature)
+        fold_case = not signature.get("case_sensitive", True)
+        compiled = self.scoring_engine.compile(signature)
+        files = self._files_for_signature(signature)
+        empty = self._parse_in_parallel(files, needle, fold_case) if self._workers > 1 else set()
+        ceiling = self.scoring_engine.score_ceiling(compiled)
+        best_score: Optional[float] = None
+        for file_path in files:
+            if file_path in empty:
+                continue
+            if best_score is not None and self.scoring_engine.max_score(compiled, file_path) <= best_score:
+                continue
+            for candidate in self._extract_candidates(file_path, needle=needle, fold_case=fold_case):
+                report = self.scoring_engine.score(self._snapshot(candidate), compiled)
                 if report.total <= 0:
                     continue
-                yield DiscoveryResult(
-                    name=candidate.name,
-                    type=candidate.type,
-                    module=candidate.module,
-                    file_path=candidate.file_path,
-                    lineno=candidate.lineno,
-                    methods=candidate.methods,
-                    decorators=candidate.decorators,
-                    bases=candidate.bases,
-                    docstring=candidate.docstring,
-                    score=report.total,
-                    score_breakdown=report.breakdown,
-                    score_details=report.details,
-                    root=self.root,
-                )
+                if best_only and (best_score is None or report.total > best_score):
+                    best_score = report.total
+                yield self._result(candidate, report)
+                # Ties keep the earlier candidate, so nothing after this can win
+                if best_only and best_score is not None and best_score >= ceiling:
+                    return
+
+    def _best_matches(self, signatures: Sequence[Dict[str, Any]]) -> List[Optional[DiscoveryResult]]:
+        """``_best_match`` for several signatures sharing one pass over the files."""
+
+        compiled = [self.scoring_engine.compile(signature) for signature in signatures]
+        fold_case = any(not signature.get("case_sensitive", True) for signature in signatures)
+        needle = _needle_gate([self._name_needle(signature) for signature in signatures], fold_case)
+
+        # A plain name only scores against candidate names containing it, so
+        # one search for the union of those names rules a candidate out for
+        # all of them at once. Regex and nameless signatures see every candidate.
+        plain = [index for index, signature in enumerate(compiled) if signature.name and signature.name_re is None]
+        name_gate = None
+        if plain:
+            name_gate = re.compile("|".join(re.escape(compiled[index].name) for index in plain), re.IGNORECASE)
+        plain_set = frozenset(plain)
+
+        pinned = [self._module_files(signature.get("module")) for signature in signatures]
+        if all(group is not None for group in pinned):
+            files = list(dict.fromkeys(path for group in pinned for path in group or ()))
+        else:
+            files = self._iter_python_files()
+        empty = self._parse_in_parallel(files, needle, fold_case) if self._workers > 1 else set()
 
-    def _iter_python_files(self) -> Iterable[Path]:
-        root_len = len(self.root.parts)
-        for dirpath, dirnames, filenames in os.walk(self.root):
-            dir_path = Path(dirpath)
-            depth = len(dir_path.parts) - root_len
-            if depth > self._max_depth:
-                dirnames[:] = []
+        ceilings = [self.scoring_engine.score_ceiling(signature) for signature in compiled]
+        best: List[Optional[DiscoveryResult]] = [None] * len(signatures)
+        for file_path in files:
+            if file_path in empty:
                 continue
-
-            filtered_dirs = []
-            for name in dirnames:
-                if self._should_skip_directory(Path(name)):
+            unsettled = [index for index, result in enumerate(best) if result is None or result.score < ceilings[index]]
+            if not unsettled:
+                break
+            live = [
+                index
+                for index in unsettled
+                if best[index] is None or self.scoring_engine.max_score(compiled[index], file_path) > best[index].score
+            ]
+            if not live:
+                continue
+            ungated = [index for index in live if index not in plain_set]
+            for candidate in self._extract_candidates(file_path, needle=needle, fold_case=fold_case):
+                targets = live if name_gate is None or name_gate.search(candidate.name) else ungated
+                if not targets:
                     continue
-                filtered_dirs.append(name)
-            dirnames[:] = filtered_dirs
+                snapshot = self._snapshot(candidate)
+                for index in targets:
+                    report = self.scoring_engine.score(snapshot, compiled[index])
+                    current = best[index]
+                    if report.total > 0 and (current is None or report.total > current.score):
+                        best[index] = self._result(candidate, report)
+        return best
 
-            for filename in filenames:
-                file_path = dir_path / filename
-                if not file_path.suffix in self._extensions:
-                    continue
-                if self._should_skip_file(file_path):
-                    continue
-                yield file_path
+    @staticmethod
+    def _snapshot(candidate: _Candidate) -> CandidateSnapshot:
+        return CandidateSnapshot(
+            name=candidate.name,
+            type=candidate.type,
+            module=candidate.module,
+            file_path=candidate.file_path,
+            methods=candidate.methods,
+            decorators=candidate.decorators,
+            bases=candidate.bases,
+            docstring=candidate.docstring,
+            name_lower=candidate.name_lower,
+        )
 
-    def _should_skip_directory(self, relative: Path) -> bool:
-        name = relative.name
-        if name.startswith('.') and name not in {'.', '..'}:
-            return True
-        return any(fragment.rstrip('/') == name or fragment in relative.as_posix() for fragment in self._skip_dirs)
+    def _result(self, candidate: _Candidate, report: ScoreReport) -> DiscoveryResult:
+        return DiscoveryResult(
+            name=candidate.name,
+            type=candidate.type,
+            module=candidate.module,
+            file_path=candidate.file_path,
+            lineno=candidate.lineno,
+            methods=candidate.methods,
+            decorators=candidate.decorators,
+            bases=candidate.bases,
+            docstring=candidate.docstring,
+            score=report.total,
+            score_breakdown=report.breakdown,
+            score_details=report.details,
+            root=self.root,
+        )
 
-    def _should_skip_file(self, file_path: Path) -> bool:
-        rel = file_path.relative_to(self.root).as_posix()
-        for pattern in self._skip_files:
-            if _matches_glob(rel, pattern):
+    def _iter_python_files(self) -> List[Path]:
+        if self._files is None or self._tree_changed():
+            scan_started = time.time_ns()
+            self._files, self._dir_mtimes = self._scan_python_files()
+            # A directory modified this close to the scan may change again
+            # without its (coarse) mtime moving, so such a listing is only
+            # used once.
+            self._files_trusted = all(
+                scan_started - mtime > _RACY_MTIME_WINDOW_NS for mtime in self._dir_mtimes.values()
+            )
+        return self._files
+
+    def _tree_changed(self) -> bool:
+        if not self._files_trusted:
+            return True
+        # Adding, removing or renaming an entry bumps its directory's mtime,
+        # so one stat per visited directory revalidates the cached file list.
+        for dirpath, mtime in self._dir_mtimes.items():
+            try:
+                if os.stat(dirpath).st_mtime_ns != mtime:
+                    return True
+            except OSError:
                 return True
         return False
 
-    def _extract_candidates(self, file_path: Path) -> Iterator[_Candidate]:
+    def _scan_python_files(self) -> Tuple[List[Path], Dict[str, int]]:
+        files: List[Path] = []
+        dir_mtimes: Dict[str, int] = {}
+        root = str(self.root)
         try:
-            source = file_path.read_text(encoding="utf-8")
+            dir_mtimes[root] = os.stat(root).st_mtime_ns
         except OSError:
-            return iter(())
+            return files, dir_mtimes
+
+        # Depth-first, each directory's files before its subdirectories, in
+        # the same order os.walk would produce them.
+        # Each entry carries its root-relative posix prefix ("" or "a/b/") so
+        # skip patterns never need Path.relative_to().
+        stack: List[Tuple[str, int, str]] = [(root, 0, "")]
+        while stack:
+            dirpath, depth, rel_prefix = stack.pop()
+            try:
+                with os.scandir(dirpath) as it:
+                    entries = list(it)
+            except OSError:
+                continue
 
+            subdirs = []
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if is_dir:
+                    if (
+                        depth < self._max_depth
+                        and not entry.is_symlink()
+                        and not self._should_skip_directory(entry.name)
+                    ):
+                        subdirs.append(entry)
+                    continue
+                if os.path.splitext(entry.name)[1] not in self._extensions:
+                    continue
+                if self._should_skip_file(rel_prefix + entry.name):
+                    continue
+                files.append(Path(entry.path))
+
+            for entry in reversed(subdirs):
+                try:
+                    dir_mtimes[entry.path] = entry.stat().st_mtime_ns
+                except OSError:
+                    continue
+                stack.append((entry.path, depth + 1, f"{rel_prefix}{entry.name}/"))
+        return files, dir_mtimes
+
+    def _should_skip_directory(self, name: str) -> bool:
+        if name.startswith('.') and name not in {'.', '..'}:
+            return True
+        if name in self._skip_dir_names:
+            return True
+        return self._skip_dir_re is not None and self._skip_dir_re.search(name) is not None
+
+    def _should_skip_file(self, rel: str) -> bool:
+        return self._skip_file_re is not None and self._skip_file_re.match(rel) is not None
+
+    def _extract_candidates(
+        self,
+        file_path: Path,
+        *,
+        needle: Optional[_Needle] = None,
+        fold_case: bool = False,
+    ) -> Iterator[_Candidate]:
         try:
-            tree = ast.parse(source, filename=str(file_path))
-        except SyntaxError:
+            stat = file_path.stat()
+        except OSError:
+            return iter(())
+
+        key = (self.root, file_path)
+        cached = _CANDIDATE_CACHE.get(key)
+        if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            _CANDIDATE_CACHE.move_to_end(key)
+            return iter(cached[2])
+
+        entry = _parse_file((file_path, self._module_name_for(file_path), needle, fold_case))
+        if entry is None:
             return iter(())
+        self._store_candidates(file_path, entry)
+        return iter(entry[2])
+
+    def _parse_in_parallel(self, files: Sequence[Path], needle: Optional[_Needle], fold_case: bool) -> Set[Path]:
+        """Parse files missing from the candidate cache across worker processes.
+
+        Parsing is CPU bound, so threads would not help. Results are stored in
+        the candidate cache for the serial pass to pick up; the files that
+        produced nothing are returned so that pass does not read them again.
+        """
+
+        pending = [file_path for file_path in files if (self.root, file_path) not in _CANDIDATE_CACHE]
+        if len(pending) < _PARALLEL_PARSE_THRESHOLD:
+            return set()
+
+        jobs = [(file_path, self._module_name_for(file_path), needle, fold_case) for file_path in pending]
+        empty: Set[Path] = set()
+        with concurrent.futures.ProcessPoolExecutor(max_workers=self._workers) as pool:
+            for file_path, entry in zip(pending, pool.map(_parse_file, jobs, chunksize=32)):
+                if entry is None:
+                    empty.add(file_path)
+                else:
+                    self._store_candidates(file_path, entry)
+        return empty
+
+    def _store_candidates(self, file_path: Path, entry: _CacheEntry) -> None:
+        _CANDIDATE_CACHE[(self.root, file_path)] = entry
+        if len(_CANDIDATE_CACHE) > _CANDIDATE_CACHE_SIZE:
+            _CANDIDATE_CACHE.popitem(last=False)
 
-        module_name = self._module_name_for(file_path)
+    @staticmethod
+    def _candidates_from_tree(tree: ast.Module, file_path: Path, module_name: str) -> Iterator[_Candidate]:
+        # Identifiers from the parser are already interned; dotted decorator
+        # and base names are built here, and recur across most files.
         for node in tree.body:
             if isinstance(node, ast.ClassDef):
                 methods = tuple(
@@ -322,8 +597,8 @@ class DiscoveryEngine:
                     for child in node.body
                     if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef))
                 )
-                decorators = tuple(self._expr_to_name(expr) for expr in node.decorator_list)
-                bases = tuple(self._expr_to_name(expr) for expr in node.bases)
+                decorators = tuple(sys.intern(DiscoveryEngine._expr_to_name(expr)) for expr in node.decorator_list)
+                bases = tuple(sys.intern(DiscoveryEngine._expr_to_name(expr)) for expr in node.bases)
                 yield _Candidate(
                     name=node.name,
                     type="class",
@@ -336,7 +611,7 @@ class DiscoveryEngine:
                     docstring=ast.get_docstring(node),
                 )
             elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                decorators = tuple(self._expr_to_name(expr) for expr in node.decorator_list)
+                decorators = tuple(sys.intern(DiscoveryEngine._expr_to_name(expr)) for expr in node.decorator_list)
                 yield _Candidate(
                     name=node.name,
                     type="function" if isinstance(node, ast.FunctionDef) else "async_function",
@@ -424,6 +699,53 @@ class DiscoveryEngine:
             if self._cache_log_warnings:
                 logger.warning("[adaptive-tests-py] Failed to persist discovery cache %s: %s", self._cache_file, exc)
 
+    def _files_for_signature(self, signature: Dict[str, Any]) -> List[Path]:
+        """Files that can hold a match for ``signature``.
+
+        An exact ``module`` maps straight to its file paths without walking the
+        tree; a ``module_pattern`` anchored on a literal dotted prefix narrows
+        the file list to that package.
+        """
+
+        pinned = self._module_files(signature.get("module"))
+        if pinned is not None:
+            return pinned
+        files = self._iter_python_files()
+        prefix = _literal_module_prefix(signature.get("module_pattern"))
+        if not prefix:
+            return files
+        start = len(os.path.join(str(self.root), ""))
+        return [path for path in files if str(path)[start:].replace(os.sep, ".").startswith(prefix)]
+
+    def _module_files(self, module: Optional[str]) -> Optional[List[Path]]:
+        """Files that define dotted ``module``, or ``None`` to walk the tree instead."""
+
+        if not module:
+            return None
+        parts = module.split(".")
+        # Anything but identifiers (a path, "..", "my-pkg") could point outside
+        # the root; leave such names to the walk and the module score
+        if not all(part.isidentifier() for part in parts):
+            return None
+        # The walk lists a directory's own files before its subpackages, and
+        # applies the same depth, symlink and skip rules checked here.
+        layouts = [(parts[:-1], parts[-1] + ext) for ext in self._extensions]
+        layouts.append((parts, "__init__.py"))
+        files: List[Path] = []
+        for dir_parts, filename in layouts:
+            if len(dir_parts) > self._max_depth or os.path.splitext(filename)[1] not in self._extensions:
+                continue
+            if any(self._should_skip_directory(name) for name in dir_parts):
+                continue
+            if self._should_skip_file("/".join([*dir_parts, filename])):
+                continue
+            if any(self.root.joinpath(*dir_parts[: i + 1]).is_symlink() for i in range(len(dir_parts))):
+                continue
+            path = self.root.joinpath(*dir_parts, filename)
+            if path.is_file() and self._module_name_for(path) == module:
+                files.append(path)
+        return files
+
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
@@ -434,23 +756,38 @@ class DiscoveryEngine:
             parts = parts[:-1]
         else:
             parts[-1] = parts[-1][:-3]  # strip .py
-        return ".".join(parts)
+        return sys.intern(".".join(parts))
 
     @staticmethod
     def _expr_to_name(expr: ast.expr) -> str:
-        if hasattr(ast, "unparse"):
-            try:
-                return ast.unparse(expr)  # type: ignore[attr-defined]
-            except Exception:  # pragma: no cover
-                pass
+        """Dotted name behind a decorator or base, e.g. ``abc.ABC``.
+
+        Calls and subscripts reduce to what they apply to, so ``@dataclass(frozen=True)``
+        gives ``dataclass`` and ``Generic[T]`` gives ``Generic``.
+        """
         if isinstance(expr, ast.Name):
             return expr.id
         if isinstance(expr, ast.Attribute):
             return DiscoveryEngine._expr_to_name(expr.value) + "." + expr.attr
         if isinstance(expr, ast.Call):
             return DiscoveryEngine._expr_to_name(expr.func)
+        if isinstance(expr, ast.Subscript):
+            return DiscoveryEngine._expr_to_name(expr.value)
         return ast.dump(expr, annotate_fields=False)
 
+    @staticmethod
+    def _name_needle(signature: Dict[str, Any]) -> Optional[bytes]:
+        """Bytes every matching source file must contain, if known statically."""
+
+        name = signature.get("name")
+        # Non-ASCII names depend on each file's declared encoding, and
+        # bytes.lower() only folds ASCII letters
+        if not name or signature.get("regex") or not name.isascii():
+            return None
+        if not signature.get("case_sensitive", True):
+            name = name.lower()
+        return name.encode("ascii")
+
     @staticmethod
     def _normalise_signature(signature: Signature | Dict[str, Any]) -> Dict[str, Any]:
         if isinstance(signature, Signature):
@@ -478,6 +815,94 @@ class DiscoveryEngine:
 # Utilities
 # ----------------------------------------------------------------------
 
-def _matches_glob(value: str, pattern: str) -> bool:
-    regex = re.escape(pattern).replace(r"\*", ".*") + "$"
-    return re.match(regex, value) is not None
+@contextmanager
+def _root_on_path(root: Path) -> Iterator[None]:
+    """Put ``root`` at the front of ``sys.path`` unless it is already there."""
+
+    root_str = str(root)
+    if root_str in sys.path:
+        yield
+        return
+    sys.path.insert(0, root_str)
+    try:
+        yield
+    finally:
+        try:
+            sys.path.remove(root_str)
+        except ValueError:
+            pass
+
+
+def _parse_file(job: Tuple[Path, str, Optional[_Needle], bool]) -> Optional[_CacheEntry]:
+    """Read and parse one file into a candidate cache entry.
+
+    ``job`` is ``(file_path, module_name, needle, fold_case)``. Returns ``None``
+    when the file cannot be read or parsed, or its bytes do not contain
+    ``needle``. Defined at module level so worker processes can run it.
+    """
+    file_path, module_name, needle, fold_case = job
+    try:
+        stat = file_path.stat()
+        data = file_path.read_bytes()
+    except OSError:
+        return None
+
+    # Every candidate name that can score contains the signature name, so
+    # files whose bytes do not contain it are skipped before parsing.
+    if needle is not None:
+        haystack = data.lower() if fold_case else data
+        found = needle in haystack if isinstance(needle, bytes) else needle.search(haystack) is not None
+        if not found:
+            return None
+
+    # The parser decodes the bytes itself, honouring PEP 263 coding cookies
+    try:
+        tree = ast.parse(data, filename=str(file_path))
+    except SyntaxError:
+        return None
+
+    candidates = tuple(DiscoveryEngine._candidates_from_tree(tree, file_path, module_name))
+    return stat.st_mtime_ns, stat.st_size, candidates
+
+
+def _needle_gate(needles: Sequence[Optional[bytes]], fold_case: bool) -> Optional[_Needle]:
+    """Combine per-signature needles into one gate; ``None`` if any is unknown."""
+
+    if not needles or None in needles:
+        return None
+    unique = sorted({needle.lower() if fold_case else needle for needle in needles if needle is not None})
+    if len(unique) == 1:
+        return unique[0]
+    return re.compile(b"|".join(re.escape(needle) for needle in unique))
+
+
+_LITERAL_MODULE_PREFIX = re.compile(r"\^((?:\w|\\\.)+)")
+
+
+def _literal_module_prefix(pattern: Optional[str]) -> str:
+    """Dotted prefix every module matching ``pattern`` starts with, or ``""``."""
+
+    if not pattern or "|" in pattern:
+        return ""
+    match = _LITERAL_MODULE_PREFIX.match(pattern)
+    if not match:
+        return ""
+    units = re.findall(r"\\\.|\w", match.group(1))
+    if pattern[match.end() : match.end() + 1] in ("?", "*", "{"):
+        units = units[:-1]  # the quantifier makes the last character optional
+    return "".join("." if unit == "\\." else unit for unit in units)
+
+
+def _compile_any_substring(fragments: Sequence[str]) -> Optional[re.Pattern[str]]:
+    """Compile ``fragments`` into one pattern that finds any of them."""
+    if not fragments:
+        return None
+    return re.compile("|".join(re.escape(fragment) for fragment in fragments))
+
+
+def _compile_any_glob(patterns: Sequence[str]) -> Optional[re.Pattern[str]]:
+    """Compile ``*`` globs into one pattern; ``match`` tests a whole path."""
+    if not patterns:
+        return None
+    alternatives = (re.escape(pattern).replace(r"\*", ".*") for pattern in patterns)
+    return re.compile("(?:" + "|".join(alternatives) + ")$")
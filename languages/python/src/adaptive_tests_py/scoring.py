@@ -9,9 +9,21 @@ CLI ("Lens") or logs when debugging discovery behaviour.
 from __future__ import annotations
 
 import re
+import sys
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Mapping, MutableMapping, Optional
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Tuple,
+    Union,
+)
 
 
 @dataclass(frozen=True)
@@ -24,6 +36,54 @@ class CandidateSnapshot:
     decorators: Iterable[str]
     bases: Iterable[str]
     docstring: Optional[str]
+    name_lower: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class _CompiledSignature:
+    """Signature values derived once and reused for every candidate scored."""
+
+    source: Mapping[str, Any]
+    name: Optional[str]
+    name_re: Optional[re.Pattern[str]]
+    case_sensitive: bool
+    name_cmp: str
+    type: str
+    method_set: FrozenSet[str]
+    decorator_set: FrozenSet[str]
+    base_set: FrozenSet[str]
+    doc_fragments: Tuple[str, ...]
+    module: Optional[str]
+    module_pattern: Optional[str]
+    module_re: Optional[re.Pattern[str]]
+
+    @classmethod
+    def from_mapping(cls, signature: Mapping[str, Any]) -> "_CompiledSignature":
+        name = signature.get("name")
+        case_sensitive = bool(signature.get("case_sensitive", True))
+        name_re = None
+        if name and signature.get("regex"):
+            name_re = re.compile(name, 0 if case_sensitive else re.IGNORECASE)
+        module = signature.get("module")
+        module_pattern = signature.get("module_pattern")
+        return cls(
+            source=signature,
+            name=name,
+            name_re=name_re,
+            case_sensitive=case_sensitive,
+            name_cmp=(name or "") if case_sensitive else (name or "").lower(),
+            type=(signature.get("type") or "class").lower(),
+            method_set=frozenset(signature.get("methods") or ()),
+            decorator_set=frozenset(signature.get("decorators") or ()),
+            base_set=frozenset(signature.get("bases") or ()),
+            doc_fragments=tuple(fragment.lower() for fragment in (signature.get("docstring_contains") or ())),
+            module=sys.intern(module) if module else None,
+            module_pattern=module_pattern,
+            module_re=re.compile(module_pattern) if module_pattern else None,
+        )
+
+
+SignatureLike = Union[Mapping[str, Any], _CompiledSignature]
 
 
 class ScoreReport:
@@ -58,7 +118,15 @@ class ScoringEngine:
         self._module_pattern = float(config.get("module_pattern", 0.0))
         self._extension_bonus = config.get("extension_bonus", {})
 
-    def score(self, candidate: CandidateSnapshot, signature: Mapping[str, Any]) -> ScoreReport:
+    def compile(self, signature: SignatureLike) -> _CompiledSignature:
+        """Precompute ``signature`` for repeated ``score``/``max_score`` calls."""
+
+        if isinstance(signature, _CompiledSignature):
+            return signature
+        return _CompiledSignature.from_mapping(signature)
+
+    def score(self, candidate: CandidateSnapshot, signature: SignatureLike) -> ScoreReport:
+        signature = self.compile(signature)
         breakdown: MutableMapping[str, float] = {}
         details: List[Dict[str, Any]] = []
         total = 0.0
@@ -79,7 +147,7 @@ class ScoringEngine:
         ext_score = self._extension_bonus.get(candidate.file_path.suffix, 0.0)
         add("extension", ext_score, info={"extension": candidate.file_path.suffix or "<none>"})
 
-        name_score = self._score_name(candidate.name, signature)
+        name_score = self._score_name(candidate.name, signature, candidate.name_lower)
         if name_score == 0:
             return ScoreReport(0.0, {}, details)
         add("name", name_score, info={"candidate": candidate.name})
@@ -87,7 +155,7 @@ class ScoringEngine:
         type_score = self._score_type(candidate.type, signature)
         if type_score <= -999:
             return ScoreReport(0.0, {}, details)
-        add("type", type_score, info={"actual": candidate.type, "expected": signature.get("type")})
+        add("type", type_score, info={"actual": candidate.type, "expected": signature.source.get("type")})
 
         methods_score = self._score_methods(candidate, signature)
         if methods_score <= -999:
@@ -105,7 +173,7 @@ class ScoringEngine:
         add("bases", bases_score, info={"found": list(candidate.bases)})
 
         doc_score = self._score_docstring(candidate, signature)
-        add("docstring", doc_score, info={"matched": signature.get("docstring_contains")})
+        add("docstring", doc_score, info={"matched": signature.source.get("docstring_contains")})
 
         module_score = self._score_module(candidate, signature)
         if module_score <= -999:
@@ -114,6 +182,57 @@ class ScoringEngine:
 
         return ScoreReport(total, breakdown, details)
 
+    def max_score(self, signature: SignatureLike, file_path: Path) -> float:
+        """Upper bound on ``score`` for any candidate defined in ``file_path``.
+
+        Path and extension scores depend only on the file, so they are exact;
+        every other facet contributes the most it could award this signature.
+        """
+
+        signature = self.compile(signature)
+        file_score = self._score_path(file_path) + self._extension_bonus.get(file_path.suffix, 0.0)
+        return file_score + self._facets_ceiling(signature)
+
+    def score_ceiling(self, signature: SignatureLike) -> float:
+        """Upper bound on ``score`` for any candidate in any file."""
+
+        signature = self.compile(signature)
+        path_score = sum(max(0.0, value) for _, value in (*self._paths_positive, *self._paths_negative))
+        extension_score = max([0.0, *self._extension_bonus.values()])
+        return path_score + extension_score + self._facets_ceiling(signature)
+
+    def _facets_ceiling(self, signature: _CompiledSignature) -> float:
+        total = 0.0
+        if not signature.name:
+            total += self._file_name.get("partial", 0.0)
+        elif signature.name_re is not None:
+            total += self._file_name.get("regex", 0.0)
+        else:
+            total += max(
+                self._file_name.get("exact", 0.0),
+                self._file_name.get("case_insensitive", 0.0),
+                self._file_name.get("partial", 0.0),
+            )
+
+        if signature.method_set:
+            per_match = float(self._methods.get("per_match", 3.0))
+            total += max(
+                len(signature.method_set) * per_match + float(self._methods.get("all_bonus", 5.0)),
+                max(per_match, 0.5 * per_match) + float(self._methods.get("mismatch_penalty", -10.0)),
+            )
+
+        if signature.decorator_set:
+            total += self._decorators
+        if signature.base_set:
+            total += self._bases
+        total += max(0.0, len(signature.doc_fragments) * self._docstring)
+
+        if signature.module:
+            total += self._module_exact
+        elif signature.module_pattern:
+            total += self._module_pattern
+        return total
+
     # ------------------------------------------------------------------
     # Individual scoring facets
     # ------------------------------------------------------------------
@@ -128,17 +247,20 @@ class ScoringEngine:
                 score += value
         return score
 
-    def _score_name(self, candidate: str, signature: Mapping[str, Any]) -> float:
-        expected = signature.get("name")
-        if not expected:
+    def _score_name(
+        self, candidate: str, signature: _CompiledSignature, candidate_lower: Optional[str] = None
+    ) -> float:
+        if not signature.name:
             return self._file_name.get("partial", 0.0)
 
-        if signature.get("regex"):
-            flags = 0 if signature.get("case_sensitive", True) else re.IGNORECASE
-            return self._file_name.get("regex", 0.0) if re.search(expected, candidate, flags) else 0.0
+        if signature.name_re is not None:
+            return self._file_name.get("regex", 0.0) if signature.name_re.search(candidate) else 0.0
 
-        candidate_cmp = candidate if signature.get("case_sensitive", True) else candidate.lower()
-        expected_cmp = expected if signature.get("case_sensitive", True) else expected.lower()
+        if signature.case_sensitive:
+            candidate_cmp = candidate
+        else:
+            candidate_cmp = candidate_lower if candidate_lower is not None else candidate.lower()
+        expected_cmp = signature.name_cmp
 
         if candidate_cmp == expected_cmp:
             return self._file_name.get("exact", 0.0)
@@ -149,8 +271,8 @@ class ScoringEngine:
         return 0.0
 
     @staticmethod
-    def _score_type(actual: str, signature: Mapping[str, Any]) -> float:
-        expected = (signature.get("type") or "class").lower()
+    def _score_type(actual: str, signature: _CompiledSignature) -> float:
+        expected = signature.type
         actual = (actual or "").lower()
         if expected in {"any", "*"}:
             return 0.0
@@ -162,12 +284,11 @@ class ScoringEngine:
             return -1000.0
         return 0.0
 
-    def _score_methods(self, candidate: CandidateSnapshot, signature: Mapping[str, Any]) -> float:
-        required = tuple(signature.get("methods") or ())
+    def _score_methods(self, candidate: CandidateSnapshot, signature: _CompiledSignature) -> float:
+        required = signature.method_set
         if not required:
             return 0.0
-        cand_methods = set(candidate.methods)
-        matches = sum(1 for method in required if method in cand_methods)
+        matches = len(required.intersection(candidate.methods))
         if matches != len(required):
             ratio = matches / len(required)
             if ratio < 0.5:
@@ -177,40 +298,38 @@ class ScoringEngine:
         bonus = float(self._methods.get("all_bonus", 5.0))
         return len(required) * float(self._methods.get("per_match", 3.0)) + bonus
 
-    def _score_decorators(self, candidate: CandidateSnapshot, signature: Mapping[str, Any]) -> float:
-        required = tuple(signature.get("decorators") or ())
+    def _score_decorators(self, candidate: CandidateSnapshot, signature: _CompiledSignature) -> float:
+        required = signature.decorator_set
         if not required:
             return 0.0
-        cand_decorators = set(candidate.decorators)
-        if all(deco in cand_decorators for deco in required):
+        if required.issubset(candidate.decorators):
             return self._decorators
         return -1000.0
 
-    def _score_bases(self, candidate: CandidateSnapshot, signature: Mapping[str, Any]) -> float:
-        required = tuple(signature.get("bases") or ())
+    def _score_bases(self, candidate: CandidateSnapshot, signature: _CompiledSignature) -> float:
+        required = signature.base_set
         if not required:
             return 0.0
-        cand_bases = set(candidate.bases)
-        if all(base in cand_bases for base in required):
+        if required.issubset(candidate.bases):
             return self._bases
         return -1000.0
 
-    def _score_docstring(self, candidate: CandidateSnapshot, signature: Mapping[str, Any]) -> float:
-        fragments = tuple(fragment.lower() for fragment in (signature.get("docstring_contains") or ()))
+    def _score_docstring(self, candidate: CandidateSnapshot, signature: _CompiledSignature) -> float:
+        fragments = signature.doc_fragments
         if not fragments or not candidate.docstring:
             return 0.0
         lower_doc = candidate.docstring.lower()
         matches = sum(1 for fragment in fragments if fragment in lower_doc)
         return matches * self._docstring
 
-    def _score_module(self, candidate: CandidateSnapshot, signature: Mapping[str, Any]) -> float:
-        module = signature.get("module")
+    def _score_module(self, candidate: CandidateSnapshot, signature: _CompiledSignature) -> float:
+        module = signature.module
         if module:
             return self._module_exact if candidate.module == module else -1000.0
-        pattern = signature.get("module_pattern")
-        if pattern and not re.search(pattern, candidate.module):
+        pattern = signature.module_re
+        if pattern is not None and not pattern.search(candidate.module):
             return -1000.0
-        if pattern:
+        if pattern is not None:
             return self._module_pattern
         return 0.0
 
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import ast
+import importlib
+import os
 import textwrap
 import json
 import sys
@@ -145,6 +148,206 @@ def test_module_constraints(tmp_path: Path) -> None:
     assert resolved.__name__ == "TodoService"
 
 
+def test_case_insensitive_discovery_skips_unrelated_files(tmp_path: Path) -> None:
+    project = tmp_path / "project"
+    project.mkdir()
+
+    _write(
+        project / "services.py",
+        """
+        class TodoService:
+            def add(self):
+                pass
+        """,
+    )
+    # Never parsed: its bytes do not contain the signature name
+    _write(project / "broken.py", "class Unrelated(:\n")
+
+    engine = DiscoveryEngine(root=str(project))
+    result = engine.discover(Signature(name="todoservice", case_sensitive=False), load=False)
+    assert result.name == "TodoService"
+
+
+def test_parsed_candidates_reused_until_file_changes(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    project = tmp_path / "project"
+    project.mkdir()
+    source = project / "services.py"
+    _write(source, "class ReportService:\n    def build(self):\n        pass")
+
+    parsed = []
+    real_parse = ast.parse
+    monkeypatch.setattr(ast, "parse", lambda *args, **kwargs: parsed.append(args) or real_parse(*args, **kwargs))
+
+    engine = DiscoveryEngine(root=str(project), config={"discovery": {"cache": {"enabled": False}}})
+    engine.discover_all(Signature(name="ReportService"))
+    engine.discover_all(Signature(name="ReportService", methods=["build"]))
+    assert len(parsed) == 1
+
+    _write(source, "class ReportService:\n    def render(self):\n        pass")
+    stat = source.stat()
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert engine.discover_all(Signature(name="ReportService"))[0].methods == ("render",)
+    assert len(parsed) == 2
+
+
+def test_file_list_picks_up_new_files(tmp_path: Path) -> None:
+    project = tmp_path / "project"
+    (project / "pkg").mkdir(parents=True)
+    _write(project / "pkg" / "first.py", "class FirstService:\n    pass")
+
+    engine = DiscoveryEngine(root=str(project), config={"discovery": {"cache": {"enabled": False}}})
+    assert engine.discover(Signature(name="FirstService"), load=False).name == "FirstService"
+
+    _write(project / "pkg" / "second.py", "class SecondService:\n    pass")
+    assert engine.discover(Signature(name="SecondService"), load=False).module == "pkg.second"
+
+
+def test_best_match_skips_files_that_cannot_win(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    project = tmp_path / "project"
+    (project / "legacy").mkdir(parents=True)
+    _write(project / "services.py", "class TodoService:\n    def add(self):\n        pass")
+    _write(project / "legacy" / "services_old.py", "class TodoService:\n    def add(self):\n        pass")
+
+    read = []
+    real_read_bytes = Path.read_bytes
+    monkeypatch.setattr(Path, "read_bytes", lambda self: read.append(self.name) or real_read_bytes(self))
+
+    engine = DiscoveryEngine(root=str(project), config={"discovery": {"cache": {"enabled": False}}})
+    result = engine.discover(Signature(name="TodoService", methods=["add"]), load=False)
+
+    assert result.file_path.name == "services.py"
+    assert read == ["services.py"]
+    assert len(engine.discover_all(Signature(name="TodoService", methods=["add"]))) == 2
+
+
+def test_parallel_parsing_matches_serial_results(tmp_path: Path) -> None:
+    project = tmp_path / "project"
+    project.mkdir()
+    for index in range(80):
+        _write(project / f"module_{index}.py", f"class Worker{index}:\n    def run(self):\n        pass")
+    _write(project / "broken.py", "class Worker(:\n")
+
+    signature = Signature(name="Worker1", methods=["run"])
+    serial = DiscoveryEngine(root=str(project), config={"discovery": {"cache": {"enabled": False}}})
+    expected = [(r.name, r.module, r.score) for r in serial.discover_all(signature)]
+    serial.clear_cache()
+
+    parallel = DiscoveryEngine(root=str(project), config={"discovery": {"workers": 2, "cache": {"enabled": False}}})
+    assert [(r.name, r.module, r.score) for r in parallel.discover_all(signature)] == expected
+
+
+def test_decorators_and_bases_match_by_dotted_name(tmp_path: Path) -> None:
+    project = tmp_path / "project"
+    project.mkdir()
+    _write(
+        project / "models.py",
+        """
+        import abc
+        import dataclasses
+        from typing import Generic, TypeVar
+
+        T = TypeVar("T")
+
+        @dataclasses.dataclass(frozen=True)
+        class Record(abc.ABC, Generic[T]):
+            pass
+        """,
+    )
+
+    engine = DiscoveryEngine(root=str(project))
+    signature = Signature(name="Record", decorators=["dataclasses.dataclass"], bases=["abc.ABC", "Generic"])
+    result = engine.discover(signature, load=False)
+    assert result.decorators == ("dataclasses.dataclass",)
+    assert result.bases == ("abc.ABC", "Generic")
+
+
+def test_pinned_module_is_found_without_walking_the_tree(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    project = tmp_path / "project"
+    (project / "services").mkdir(parents=True)
+    (project / "legacy").mkdir()
+    _write(project / "services" / "todo.py", "class TodoService:\n    pass")
+    _write(project / "legacy" / "todo.py", "class TodoService:\n    pass")
+
+    engine = DiscoveryEngine(root=str(project), config={"discovery": {"cache": {"enabled": False}}})
+    found = engine.discover(Signature(name="TodoService", module_pattern=r"^legacy\."), load=False)
+    assert found.module == "legacy.todo"
+
+    def no_walk(self: DiscoveryEngine) -> None:
+        raise AssertionError("tree walked for a pinned module")
+
+    monkeypatch.setattr(DiscoveryEngine, "_iter_python_files", no_walk)
+    found = engine.discover(Signature(name="TodoService", module="services.todo"), load=False)
+    assert found.file_path == project / "services" / "todo.py"
+
+    outside = tmp_path / "evilmod.py"
+    _write(outside, "class Evil:\n    pass")
+    monkeypatch.undo()
+    with pytest.raises(DiscoveryError):
+        engine.discover(Signature(name="Evil", module=str(tmp_path / "evilmod")), load=False)
+
+
+def test_discover_many_matches_individual_discovery(tmp_path: Path) -> None:
+    project = tmp_path / "project"
+    (project / "services").mkdir(parents=True)
+    _write(project / "services" / "todo.py", "class TodoService:\n    def add(self):\n        pass")
+    _write(project / "services" / "user.py", "class UserService:\n    pass\n\nclass UserServiceMock:\n    pass")
+    _write(project / "services" / "mail.py", "def send_mail():\n    pass")
+
+    config = {"discovery": {"cache": {"enabled": False}}}
+    signatures = [
+        Signature(name="UserService"),
+        Signature(name="todoservice", case_sensitive=False, methods=["add"]),
+        Signature(name=r"^send_", type="function", regex=True),
+    ]
+    batch = DiscoveryEngine(root=str(project), config=config).discover_many(signatures, load=False)
+    single = DiscoveryEngine(root=str(project), config=config)
+    assert [(r.module, r.name, r.score) for r in batch] == [
+        (r.module, r.name, r.score) for r in (single.discover(sig, load=False) for sig in signatures)
+    ]
+
+    with pytest.raises(DiscoveryError):
+        DiscoveryEngine(root=str(project), config=config).discover_many([Signature(name="Missing")], load=False)
+
+
+def test_load_many_puts_root_on_path_once(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    project = tmp_path / "project"
+    project.mkdir()
+    _write(project / "bulk_alpha.py", "class AlphaService:\n    pass")
+    _write(project / "bulk_beta.py", "def beta_handler():\n    pass")
+
+    engine = DiscoveryEngine(root=str(project), config={"discovery": {"cache": {"enabled": False}}})
+    signatures = [Signature(name="AlphaService"), Signature(name="beta_handler", type="function")]
+    results = engine.discover_many(signatures, load=False)
+
+    class RecordingPath(list):
+        def __init__(self, items: Any) -> None:
+            super().__init__(items)
+            self.inserted: list = []
+
+        def insert(self, index: Any, item: Any) -> None:
+            self.inserted.append(item)
+            super().insert(index, item)
+
+    root = str(engine.root)
+    path = RecordingPath(sys.path)
+    monkeypatch.setattr(sys, "path", path)
+    root_entries = []
+    import_module = importlib.import_module
+
+    def recording_import(name: str, package: Any = None) -> Any:
+        root_entries.append(sys.path.count(root))
+        return import_module(name, package)
+
+    monkeypatch.setattr(importlib, "import_module", recording_import)
+
+    path_before = list(sys.path)
+    alpha, beta = engine.load_many(results)
+    assert (alpha.__name__, beta.__name__) == ("AlphaService", "beta_handler")
+    assert root_entries == [1, 1]
+    assert path.inserted == [root]
+    assert sys.path == path_before
+
+
 def test_explain_returns_ranked_candidates(tmp_path: Path) -> None:
     project = tmp_path / "project"
     project.mkdir()